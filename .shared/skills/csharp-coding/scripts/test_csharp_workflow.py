@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for csharp_workflow.py project file discovery."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+WORKFLOW_PATH = SCRIPTS_DIR / "csharp_workflow.py"
+
+
+def load_workflow_module():
+    spec = importlib.util.spec_from_file_location("csharp_workflow", WORKFLOW_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load module from {WORKFLOW_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["csharp_workflow"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+workflow = load_workflow_module()
+
+
+class FindFilesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = Path(tempfile.mkdtemp(prefix="csharp-workflow-"))
+        for rel in (
+            "global.json",
+            "App.sln",
+            "Root.csproj",
+            "src/global.json",
+            "src/App/App.csproj",
+            "src/App/bin/Debug/Copy.csproj",
+            "src/App/obj/Generated.csproj",
+            "node_modules/pkg/Pkg.csproj",
+            ".git/Hidden.csproj",
+            "packages/Lib/Lib.csproj",
+        ):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def rel_results(self, patterns: tuple[str, ...]) -> list[str]:
+        return [path.relative_to(self.root).as_posix() for path in workflow.find_files(self.root, patterns)]
+
+    def test_root_patterns_match_top_level_only(self) -> None:
+        self.assertEqual(self.rel_results(("global.json", "*.sln")), ["App.sln", "global.json"])
+
+    def test_recursive_pattern_prunes_build_and_vcs_dirs(self) -> None:
+        self.assertEqual(
+            self.rel_results(("**/*.csproj",)),
+            ["Root.csproj", "packages/Lib/Lib.csproj", "src/App/App.csproj"],
+        )
+
+    def test_mixed_patterns_share_one_walk(self) -> None:
+        self.assertEqual(
+            self.rel_results(("global.json", "**/*.csproj")),
+            ["Root.csproj", "global.json", "packages/Lib/Lib.csproj", "src/App/App.csproj"],
+        )
+
+    def test_nested_path_patterns_are_rejected(self) -> None:
+        for pattern in ("src/*.csproj", "**/src/*.csproj"):
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    workflow.find_files(self.root, (pattern,))
+
+    @unittest.skipUnless(os.name == "nt", "file name matching is case-insensitive on Windows only")
+    def test_matching_ignores_case_on_windows(self) -> None:
+        (self.root / "nuget.config").touch()
+        (self.root / "src" / "Upper.CSPROJ").touch()
+        self.assertEqual(
+            self.rel_results(("NuGet.config", "**/*.csproj")),
+            ["Root.csproj", "nuget.config", "packages/Lib/Lib.csproj", "src/App/App.csproj", "src/Upper.CSPROJ"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
-SOURCE_EXTS = {".c", ".cc", ".cpp", ".cxx", ".h", ".hh", ".hpp", ".hxx", ".inl", ".glsl", ".hlsl"}
+SOURCE_EXTS = (".c", ".cc", ".cpp", ".cxx", ".h", ".hh", ".hpp", ".hxx", ".inl", ".glsl", ".hlsl")
 
 @dataclass(frozen=True)
 class Rule:
@@ -82,15 +82,14 @@ RULES = [
 
 def iter_files(root: Path) -> Iterable[Path]:
     if root.is_file():
-        if root.suffix.lower() in SOURCE_EXTS:
+        if root.name.lower().endswith(SOURCE_EXTS):
             yield root
         return
     for dirpath, dirnames, filenames in os.walk(root):
         dirnames[:] = [d for d in dirnames if d not in {".git", "build", "cmake-build-debug", "cmake-build-release", "out", "third_party", "external"}]
         for filename in filenames:
-            path = Path(dirpath) / filename
-            if path.suffix.lower() in SOURCE_EXTS:
-                yield path
+            if filename.lower().endswith(SOURCE_EXTS):
+                yield Path(dirpath) / filename
 
 
 def scan_file(path: Path) -> list[tuple[int, Rule, str]]:
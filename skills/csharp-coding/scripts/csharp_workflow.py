@@ -8,14 +8,33 @@ assistant can adapt after inspecting the repository.
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import os
 from pathlib import Path
 
+EXCLUDED_DIRS = frozenset({".git", ".vs", "bin", "obj", "node_modules"})
+
 
 def find_files(root: Path, patterns: tuple[str, ...]) -> list[Path]:
+    """Match bare file-name globs; "**/" patterns recurse but skip EXCLUDED_DIRS."""
+    root_patterns = tuple(p for p in patterns if not p.startswith("**/"))
+    deep_patterns = tuple(p[3:] for p in patterns if p.startswith("**/"))
+    for pattern in root_patterns + deep_patterns:
+        if "/" in pattern or "\\" in pattern:
+            raise ValueError(f"Unsupported pattern (bare file name or '**/' prefix only): {pattern}")
+    excluded = {os.path.normcase(name) for name in EXCLUDED_DIRS}
+    top = os.fspath(root)
     results: list[Path] = []
-    for pattern in patterns:
-        results.extend(root.glob(pattern))
-    return sorted(set(results))
+    for dirpath, dirnames, filenames in os.walk(top):
+        active = root_patterns + deep_patterns if dirpath == top else deep_patterns
+        for filename in filenames:
+            if any(fnmatch.fnmatch(filename, pattern) for pattern in active):
+                results.append(Path(dirpath) / filename)
+        if deep_patterns:
+            dirnames[:] = [d for d in dirnames if os.path.normcase(d) not in excluded]
+        else:
+            dirnames[:] = []
+    return sorted(results)
 
 
 def rel(path: Path, root: Path) -> str: